@@ -1,6 +1,12 @@
-"""Async Python SDK for the go2.gg Links API."""
+"""Async Python SDK for the go2.gg Links API.
 
+For lower asyncio overhead, install the ``speedups`` extra and call
+``go2gg.install_fast_event_loop()`` before starting the event loop to run on uvloop.
+"""
+
+from go2gg._pool import close_shared_sessions
 from go2gg.client import Go2Client
+from go2gg.eventloop import install_fast_event_loop
 from go2gg.exceptions import APIError, Go2Error, RequestError
 from go2gg.types import (
     CountByBrowser,
@@ -28,4 +34,6 @@ __all__ = [
     "CountByBrowser",
     "CountByReferrer",
     "CountByDate",
+    "install_fast_event_loop",
+    "close_shared_sessions",
 ]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+"""Event-loop scoped aiohttp sessions shared between clients."""
+
+import asyncio
+
+import aiohttp
+
+# Each session and its connector hold a strong reference to their loop, so entries are keyed strongly
+# and evicted explicitly once the loop is closed.
+_shared_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def _evict_closed_loops() -> None:
+    """Drop sessions whose event loop has been closed without calling close_shared_sessions()."""
+    for loop in [loop for loop in _shared_sessions if loop.is_closed()]:
+        del _shared_sessions[loop]
+
+
+def get_shared_session(
+    *,
+    limit: int,
+    limit_per_host: int,
+    keepalive_timeout: float,
+    ttl_dns_cache: int,
+) -> aiohttp.ClientSession:
+    """Return the shared session for the running event loop, creating it on first use.
+
+    The connector settings of the first caller are used for the lifetime of the session. Sessions left
+    behind by event loops that have since been closed are evicted here.
+    """
+    _evict_closed_loops()
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _shared_sessions[loop] = session
+    return session
+
+
+async def close_shared_sessions() -> None:
+    """Close the shared session of the running event loop, if one was created.
+
+    Await this before the event loop stops so the pooled connections are closed cleanly. Sessions of
+    loops closed without it are only dropped on the next shared-session lookup.
+    """
+    _evict_closed_loops()
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
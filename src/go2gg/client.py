@@ -3,12 +3,21 @@ from __future__ import annotations
 """Async client for the go2.gg Links API."""
 
 import asyncio
+import hashlib
 import os
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping, MutableMapping
+from email.utils import parsedate_to_datetime
 from types import TracebackType
-from typing import Any
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urlencode
 
 import aiohttp
+import orjson
+from yarl import URL
 
+from go2gg._pool import get_shared_session
 from go2gg.exceptions import APIError, RequestError
 from go2gg.resources import LinksAPI
 
@@ -17,8 +26,139 @@ DEFAULT_TIMEOUT_TOTAL = 30.0
 DEFAULT_TIMEOUT_CONNECT = 10.0
 DEFAULT_TIMEOUT_SOCK_READ = 30.0
 DEFAULT_TIMEOUT_SOCK_CONNECT = 10.0
+# Shared by every client that keeps the default timeouts; ClientTimeout is immutable.
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
+    total=DEFAULT_TIMEOUT_TOTAL,
+    connect=DEFAULT_TIMEOUT_CONNECT,
+    sock_read=DEFAULT_TIMEOUT_SOCK_READ,
+    sock_connect=DEFAULT_TIMEOUT_SOCK_CONNECT,
+)
 DEFAULT_RETRY_DELAY = 0.5
-DEFAULT_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+DEFAULT_RETRY_MAX_DELAY = 30.0
+# 408 Request Timeout, 425 Too Early, 429 Too Many Requests, 5xx gateway errors and 529 Overloaded.
+DEFAULT_RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504, 529})
+DEFAULT_CONNECTOR_LIMIT = 100
+DEFAULT_CONNECTOR_LIMIT_PER_HOST = 50
+DEFAULT_KEEPALIVE_TIMEOUT = 75.0
+DEFAULT_DNS_CACHE_TTL = 300
+
+# Cached GET response: (ETag, monotonic expiry from max-age, decoded payload).
+CacheEntry = tuple[Optional[str], Optional[float], dict[str, Any]]
+
+
+class RetryPolicy(NamedTuple):
+    """Retry settings resolved once per client."""
+
+    retries: int
+    delay: float
+    backoff: bool
+    jitter: bool
+    max_delay: float
+    status_codes: frozenset[int]
+
+    def delay_for(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the seconds to wait before retrying after a failed attempt."""
+        if retry_after is not None:
+            # The server's Retry-After hint wins over the local schedule.
+            return min(retry_after, self.max_delay)
+        if self.delay <= 0:
+            return 0.0
+        if self.jitter:
+            growth = 3 ** (attempt + 1) if self.backoff else 3
+            upper = min(self.max_delay, self.delay * growth)
+            return random.uniform(min(self.delay, self.max_delay), upper)  # nosec B311
+        if self.backoff:
+            backoff_delay: float = self.delay * 2**attempt
+            return min(backoff_delay, self.max_delay)
+        return min(self.delay, self.max_delay)
+
+
+async def _decode(response: aiohttp.ClientResponse) -> Any:
+    """Decode a response body with orjson, wrapping non-JSON bodies as {"message": text}."""
+    if response.content_type == "text/html":
+        # Proxy and gateway error pages are HTML; don't attempt to decode those. Other content types are
+        # still tried as JSON because the API's JSON is not always labelled as such.
+        return {"message": await response.text()}
+    body = await response.read()
+    if not body.strip():
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return {"message": await response.text()}
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _parse_max_age(cache_control: str) -> float | None:
+    """Return the max-age directive of a Cache-Control header in seconds, if present."""
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return max(0.0, float(value.strip('"')))
+            except ValueError:
+                return None
+    return None
+
+
+def _store_cached(
+    cache: MutableMapping[str, CacheEntry],
+    key: str,
+    headers: Mapping[str, str],
+    payload: dict[str, Any],
+    previous_etag: str | None = None,
+) -> None:
+    """Remember a GET payload when the response allows revalidation or reuse."""
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        cache.pop(key, None)
+        return
+    etag = headers.get("ETag") or previous_etag
+    max_age = None if "no-cache" in cache_control else _parse_max_age(cache_control)
+    if etag is None and not max_age:
+        return
+    expires_at = time.monotonic() + max_age if max_age else None
+    cache[key] = (etag, expires_at, payload)
+
+
+def _cache_key(scope: str, url: URL, params: dict[str, Any] | None) -> str:
+    """Build the cache key for a GET request from the credential scope, URL and query parameters."""
+    if not params:
+        return f"{scope} {url}"
+    return f"{scope} {url}?{urlencode(sorted(params.items()))}"
+
+
+def _invalidate_cached(cache: MutableMapping[str, CacheEntry], scope: str, url: URL) -> None:
+    """Drop cached entries a write to url may have changed.
+
+    That is the URL itself with any query, everything below it, and the list pages of its parent collection.
+    """
+    target = f"{scope} {url}"
+    collection = f"{scope} {url.parent}"
+    stale = [
+        key
+        for key in cache
+        if key == target
+        or key.startswith((f"{target}/", f"{target}?"))
+        or key == collection
+        or key.startswith(f"{collection}?")
+    ]
+    for key in stale:
+        del cache[key]
 
 
 class Go2Client:
@@ -28,6 +168,12 @@ class Go2Client:
         api_key: API key for authentication. If omitted, uses GO2GG_API_KEY.
         base_url: API base URL.
         session: Optional shared aiohttp session.
+        shared_session: Whether to use a session shared by all clients on the running event loop, so
+            short-lived clients reuse pooled connections. Must be created inside a running event loop;
+            call ``go2gg.close_shared_sessions()`` at shutdown.
+        connector_limit: Maximum number of simultaneous connections for a managed session.
+        connector_limit_per_host: Maximum number of simultaneous connections to the API host.
+        keepalive_timeout: Seconds to keep idle connections open for reuse.
         timeout: Optional aiohttp timeout for a managed session. Overrides individual timeout values.
         timeout_total: Total request timeout in seconds.
         timeout_connect: Connection timeout in seconds.
@@ -37,7 +183,14 @@ class Go2Client:
         retry_count: Number of retry attempts for retryable failures.
         retry_delay: Base delay in seconds between retries.
         retry_backoff: Whether to apply exponential backoff to retry delays.
+        retry_jitter: Whether to randomize retry delays (decorrelated jitter) so concurrent callers spread out.
+        retry_max_delay: Upper bound in seconds for any single retry delay, including Retry-After.
         retry_status_codes: HTTP status codes that should trigger retries.
+        retry_sleep: Coroutine function used to wait between retries. Defaults to ``asyncio.sleep``.
+        cache: Optional mapping used to cache GET responses by ETag and Cache-Control max-age.
+            Entries are scoped by API key, so one mapping may be shared between clients. Caching is
+            disabled when omitted.
+        keep_raw: Whether returned Links keep their response payload as ``Link.raw``.
     """
 
     def __init__(
@@ -46,6 +199,10 @@ class Go2Client:
         api_key: str | None = None,
         base_url: str = DEFAULT_BASE_URL,
         session: aiohttp.ClientSession | None = None,
+        shared_session: bool = False,
+        connector_limit: int = DEFAULT_CONNECTOR_LIMIT,
+        connector_limit_per_host: int = DEFAULT_CONNECTOR_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
         timeout: aiohttp.ClientTimeout | None = None,
         timeout_total: float = DEFAULT_TIMEOUT_TOTAL,
         timeout_connect: float = DEFAULT_TIMEOUT_CONNECT,
@@ -55,7 +212,12 @@ class Go2Client:
         retry_count: int = 0,
         retry_delay: float = DEFAULT_RETRY_DELAY,
         retry_backoff: bool = False,
-        retry_status_codes: set[int] | None = None,
+        retry_jitter: bool = False,
+        retry_max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        retry_status_codes: Iterable[int] | None = None,
+        retry_sleep: Callable[[float], Awaitable[None]] | None = None,
+        cache: MutableMapping[str, CacheEntry] | None = None,
+        keep_raw: bool = False,
     ) -> None:
         """Initialize the client and configure authentication."""
         resolved_key = api_key or os.getenv("GO2GG_API_KEY")
@@ -65,22 +227,77 @@ class Go2Client:
             )
         if not base_url:
             raise ValueError("base_url is required")
+        if session is not None and shared_session:
+            raise ValueError("session and shared_session cannot be used together")
 
         self._api_key = resolved_key
-        self._base_url = base_url.rstrip("/")
-        resolved_timeout = timeout or aiohttp.ClientTimeout(
-            total=timeout_total,
-            connect=timeout_connect,
-            sock_read=timeout_sock_read,
-            sock_connect=timeout_sock_connect,
+        self._base_url = URL(base_url.rstrip("/"))
+        # Built once; the same instance is the managed session default or is passed with each shared-session request.
+        if timeout is not None:
+            self._timeout = timeout
+        elif (timeout_total, timeout_connect, timeout_sock_read, timeout_sock_connect) == (
+            DEFAULT_TIMEOUT.total,
+            DEFAULT_TIMEOUT.connect,
+            DEFAULT_TIMEOUT.sock_read,
+            DEFAULT_TIMEOUT.sock_connect,
+        ):
+            self._timeout = DEFAULT_TIMEOUT
+        else:
+            self._timeout = aiohttp.ClientTimeout(
+                total=timeout_total,
+                connect=timeout_connect,
+                sock_read=timeout_sock_read,
+                sock_connect=timeout_sock_connect,
+            )
+        default_headers = {"Authorization": f"Bearer {resolved_key}"}
+        if user_agent:
+            default_headers["User-Agent"] = user_agent
+        # Per-request keyword arguments; only needed when the session's defaults are not ours.
+        self._request_options: dict[str, Any] = {}
+        if shared_session:
+            session = get_shared_session(
+                limit=connector_limit,
+                limit_per_host=connector_limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=DEFAULT_DNS_CACHE_TTL,
+            )
+            self._owns_session = False
+            self._headers: dict[str, str] | None = default_headers
+            self._request_options["timeout"] = self._timeout
+        elif session is None:
+            connector = aiohttp.TCPConnector(
+                limit=connector_limit,
+                limit_per_host=connector_limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=DEFAULT_DNS_CACHE_TTL,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                headers=default_headers,
+            )
+            self._owns_session = True
+            self._headers = None
+        else:
+            # A caller-provided session may be shared with other services, so auth is sent per request.
+            self._owns_session = False
+            self._headers = default_headers
+        self._json_headers = {**(self._headers or {}), "Content-Type": "application/json"}
+        self._session = session
+        self._retry = RetryPolicy(
+            retries=retry_count,
+            delay=retry_delay,
+            backoff=retry_backoff,
+            jitter=retry_jitter,
+            max_delay=retry_max_delay,
+            status_codes=frozenset(retry_status_codes or DEFAULT_RETRY_STATUS_CODES),
         )
-        self._session = session or aiohttp.ClientSession(timeout=resolved_timeout)
-        self._owns_session = session is None
-        self._user_agent = user_agent
-        self._retry_count = retry_count
-        self._retry_delay = retry_delay
-        self._retry_backoff = retry_backoff
-        self._retry_status_codes = retry_status_codes or DEFAULT_RETRY_STATUS_CODES
+        self._retry_sleep = retry_sleep or asyncio.sleep
+        self._cache = cache
+        # Keys in a caller-supplied cache are scoped by credential, so clients sharing it never see each
+        # other's responses; the key itself is hashed rather than stored.
+        self._cache_scope = hashlib.sha256(resolved_key.encode()).hexdigest()[:16]
+        self._keep_raw = keep_raw
 
         self.links = LinksAPI(self)
 
@@ -105,71 +322,102 @@ class Go2Client:
     async def _request(
         self,
         method: str,
-        path: str,
+        url: URL,
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Send an HTTP request and return the decoded response payload."""
-        url = f"{self._base_url}/{path.lstrip('/')}"
-        headers = {"Authorization": f"Bearer {self._api_key}"}
-        if self._user_agent:
-            headers["User-Agent"] = self._user_agent
+        headers = self._headers
+        body: bytes | None = None
+        if json is not None:
+            # orjson produces bytes directly, so aiohttp has nothing left to encode.
+            body = orjson.dumps(json)
+            headers = self._json_headers
+        cache = self._cache
+        cache_key: str | None = None
+        cached: CacheEntry | None = None
+        if cache is not None:
+            if method == "GET":
+                cache_key = _cache_key(self._cache_scope, url, params)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    etag, expires_at, cached_payload = cached
+                    if expires_at is not None and expires_at > time.monotonic():
+                        return cached_payload
+                    if etag:
+                        headers = {**(headers or {}), "If-None-Match": etag}
+            else:
+                _invalidate_cached(cache, self._cache_scope, url)
 
-        for attempt in range(self._retry_count + 1):
+        request = self._session.request
+        retry_count, retry_status_codes = self._retry.retries, self._retry.status_codes
+        for attempt in range(retry_count + 1):
+            can_retry = attempt < retry_count
+            retry_after: float | None = None
             try:
-                async with self._session.request(
+                response = await request(
                     method,
                     url,
                     params=params,
-                    json=json,
+                    data=body,
                     headers=headers,
-                ) as response:
-                    if response.status == 204:
-                        return {}
-
-                    payload: Any
-                    try:
-                        payload = await response.json(content_type=None)
-                    except aiohttp.ContentTypeError:
-                        payload = {"message": await response.text()}
-
-                    if response.status >= 400:
-                        error = self._to_api_error(response.status, payload)
-                        if self._should_retry(response.status, attempt):
-                            await self._sleep_before_retry(attempt)
-                            continue
-                        raise error
-
-                    if isinstance(payload, dict) and payload.get("success") is False:
-                        raise self._to_api_error(response.status, payload)
-
-                    if not isinstance(payload, dict):
-                        return {"data": payload}
-
-                    return payload
+                    **self._request_options,
+                )
+                try:
+                    status = response.status
+                    if can_retry and status >= 400 and status in retry_status_codes:
+                        # Drain the error body without decoding it so the connection can be reused.
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                        await response.read()
+                    else:
+                        return await self._handle_response(response, cache_key, cached)
+                finally:
+                    response.release()
             except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
-                if self._should_retry(None, attempt):
+                if can_retry:
                     await self._sleep_before_retry(attempt)
                     continue
                 raise RequestError(str(exc)) from exc
 
+            await self._sleep_before_retry(attempt, retry_after)
+
         raise RequestError("Request failed after retries.")
 
-    def _should_retry(self, status_code: int | None, attempt: int) -> bool:
-        if attempt >= self._retry_count:
-            return False
-        if status_code is None:
-            return True
-        return status_code in self._retry_status_codes
-
-    async def _sleep_before_retry(self, attempt: int) -> None:
-        if self._retry_delay <= 0:
-            return
-        delay = self._retry_delay
-        if self._retry_backoff:
-            delay *= 2 ** attempt
-        await asyncio.sleep(delay)
+    async def _handle_response(
+        self,
+        response: aiohttp.ClientResponse,
+        cache_key: str | None,
+        cached: CacheEntry | None,
+    ) -> dict[str, Any]:
+        """Decode a final response, raising APIError for error payloads."""
+        status = response.status
+        cache = self._cache
+        if status == 304 and cache is not None and cache_key is not None and cached is not None:
+            _store_cached(cache, cache_key, response.headers, cached[2], cached[0])
+            return cached[2]
+
+        if status == 204:
+            return {}
+
+        payload = await _decode(response)
+
+        if status >= 400:
+            raise self._to_api_error(status, payload)
+
+        if isinstance(payload, dict) and payload.get("success") is False:
+            raise self._to_api_error(status, payload)
+
+        result: dict[str, Any] = payload if isinstance(payload, dict) else {"data": payload}
+        if cache is not None and cache_key is not None:
+            _store_cached(cache, cache_key, response.headers, result)
+
+        return result
+
+    async def _sleep_before_retry(self, attempt: int, retry_after: float | None = None) -> None:
+        delay = self._retry.delay_for(attempt, retry_after)
+        if delay > 0:
+            await self._retry_sleep(delay)
 
     @staticmethod
     def _to_api_error(status: int, payload: Any) -> APIError:
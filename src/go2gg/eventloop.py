@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+"""Optional event loop helpers."""
+
+import asyncio
+
+
+def install_fast_event_loop() -> bool:
+    """Use uvloop for new asyncio event loops when it is installed.
+
+    Call this once at startup, before ``asyncio.run``. It is never called implicitly.
+
+    Returns:
+        True if uvloop was installed, False if it is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
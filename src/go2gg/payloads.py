@@ -2,23 +2,82 @@ from __future__ import annotations
 
 """Helpers for request/response payload shaping."""
 
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=256)
 def snake_to_camel(value: str) -> str:
     """Convert a snake_case string to camelCase."""
     parts = value.split("_")
     return parts[0] + "".join(part[:1].upper() + part[1:] for part in parts[1:])
 
 
+# Request fields and query parameters sent by the SDK, converted once at import time.
+_SNAKE_TO_CAMEL: dict[str, str] = {
+    key: snake_to_camel(key)
+    for key in (
+        "destination_url",
+        "slug",
+        "domain",
+        "title",
+        "description",
+        "tags",
+        "password",
+        "expires_at",
+        "click_limit",
+        "geo_targets",
+        "device_targets",
+        "ios_url",
+        "android_url",
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "is_archived",
+        "page",
+        "per_page",
+        "search",
+        "tag",
+        "archived",
+        "sort",
+    )
+}
+
+
 def map_snake_keys(data: dict[str, Any]) -> dict[str, Any]:
     """Convert snake_case keys to camelCase and drop None values."""
-    return {snake_to_camel(key): value for key, value in data.items() if value is not None}
+    return {_SNAKE_TO_CAMEL.get(key) or snake_to_camel(key): value for key, value in data.items() if value is not None}
+
+
+def map_snake_pairs(pairs: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+    """Build a camelCase dict from (snake_case, value) pairs, skipping None values."""
+    return {_SNAKE_TO_CAMEL.get(key) or snake_to_camel(key): value for key, value in pairs if value is not None}
+
+
+def map_query_pairs(pairs: Iterable[tuple[str, Any]]) -> dict[str, str]:
+    """Build camelCase query parameters from (snake_case, value) pairs as strings, skipping None values."""
+    return {
+        key: "true" if value is True else "false" if value is False else str(value)
+        for key, value in map_snake_pairs(pairs).items()
+    }
+
+
+def make_picker(*keys: str) -> Callable[[dict[str, Any]], Any]:
+    """Build a getter that returns the value of the first present key, or None."""
+    if len(keys) == 1:
+        (key,) = keys
+        return lambda data: data.get(key)
+    if len(keys) == 2:
+        first, second = keys
+        return lambda data: data[first] if first in data else data.get(second)
 
+    def pick(data: dict[str, Any]) -> Any:
+        for key in keys:
+            if key in data:
+                return data[key]
+        return None
 
-def get_first(data: dict[str, Any], *keys: str) -> Any:
-    """Return the first matching key's value from a dict, or None."""
-    for key in keys:
-        if key in data:
-            return data[key]
-    return None
+    return pick
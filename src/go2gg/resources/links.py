@@ -2,15 +2,45 @@ from __future__ import annotations
 
 """Links API resource methods."""
 
-from typing import TYPE_CHECKING
+import asyncio
+import builtins
+import copy
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+from urllib.parse import quote
 
-from go2gg.payloads import map_snake_keys
+from yarl import URL
+
+from go2gg.payloads import map_query_pairs, map_snake_pairs
 from go2gg.types import Link, LinkListMeta, LinkPage, LinkStats
 
 
 if TYPE_CHECKING:
     from go2gg.client import Go2Client
 
+DEFAULT_BULK_CONCURRENCY = 16
+
+_T = TypeVar("_T")
+
+
+def _semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    """Build the semaphore for a bulk call, rejecting limits that would never admit a request."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return asyncio.Semaphore(max_concurrency)
+
+
+async def _bounded(semaphore: asyncio.Semaphore, call: Callable[[], Awaitable[_T]]) -> _T:
+    """Start a call once a slot in the semaphore is free, so its errors stay with its own result."""
+    async with semaphore:
+        return await call()
+
+
+def _parse_detached_link(data: dict[str, Any]) -> Link:
+    """Parse a Link whose ``raw`` is a copy, so mutating it cannot change a cached payload."""
+    return Link.from_dict(copy.deepcopy(data), keep_raw=True)
+
 
 class LinksAPI:
     """Links API operations."""
@@ -22,6 +52,19 @@ class LinksAPI:
             client: Authenticated Go2Client instance.
         """
         self._client = client
+        self._links_url = client._base_url / "links"
+        if client._keep_raw and client._cache is not None:
+            self._parse_link: Callable[[dict[str, Any]], Link] = _parse_detached_link
+        else:
+            self._parse_link = partial(Link.from_dict, keep_raw=client._keep_raw)
+
+    def _link_url(self, link_id: str) -> URL:
+        """Return the URL of one link, encoding the whole id (including ``/`` and ``%``) as one path segment."""
+        return URL(f"{self._links_url}/{quote(link_id, safe='')}", encoded=True)
+
+    def _raw(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Return a raw payload that callers may mutate without changing the client cache."""
+        return copy.deepcopy(payload) if self._client._cache is not None else payload
 
     async def create(
         self,
@@ -70,31 +113,73 @@ class LinksAPI:
         Returns:
             The created Link.
         """
-        payload = map_snake_keys(
-            {
-                "destination_url": destination_url,
-                "slug": slug,
-                "domain": domain,
-                "title": title,
-                "description": description,
-                "tags": tags,
-                "password": password,
-                "expires_at": expires_at,
-                "click_limit": click_limit,
-                "geo_targets": geo_targets,
-                "device_targets": device_targets,
-                "ios_url": ios_url,
-                "android_url": android_url,
-                "utm_source": utm_source,
-                "utm_medium": utm_medium,
-                "utm_campaign": utm_campaign,
-                "utm_term": utm_term,
-                "utm_content": utm_content,
-            }
+        payload = map_snake_pairs(
+            (
+                ("destination_url", destination_url),
+                ("slug", slug),
+                ("domain", domain),
+                ("title", title),
+                ("description", description),
+                ("tags", tags),
+                ("password", password),
+                ("expires_at", expires_at),
+                ("click_limit", click_limit),
+                ("geo_targets", geo_targets),
+                ("device_targets", device_targets),
+                ("ios_url", ios_url),
+                ("android_url", android_url),
+                ("utm_source", utm_source),
+                ("utm_medium", utm_medium),
+                ("utm_campaign", utm_campaign),
+                ("utm_term", utm_term),
+                ("utm_content", utm_content),
+            )
         )
-        response = await self._client._request("POST", "/links", json=payload)
+        response = await self._client._request("POST", self._links_url, json=payload)
         data = response.get("data", response)
-        return Link.from_dict(data)
+        return self._parse_link(data)
+
+    @overload
+    async def list(
+        self,
+        *,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        domain: str | None = None,
+        tag: str | None = None,
+        archived: bool | None = None,
+        sort: str | None = None,
+        raw: Literal[False] = ...,
+    ) -> LinkPage: ...
+
+    @overload
+    async def list(
+        self,
+        *,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        domain: str | None = None,
+        tag: str | None = None,
+        archived: bool | None = None,
+        sort: str | None = None,
+        raw: Literal[True],
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def list(
+        self,
+        *,
+        page: int | None = None,
+        per_page: int | None = None,
+        search: str | None = None,
+        domain: str | None = None,
+        tag: str | None = None,
+        archived: bool | None = None,
+        sort: str | None = None,
+        raw: bool,
+    ) -> LinkPage | dict[str, Any]: ...
 
     async def list(
         self,
@@ -106,7 +191,8 @@ class LinksAPI:
         tag: str | None = None,
         archived: bool | None = None,
         sort: str | None = None,
-    ) -> LinkPage:
+        raw: bool = False,
+    ) -> LinkPage | dict[str, Any]:
         """List links for the authenticated account.
 
         Args:
@@ -117,40 +203,55 @@ class LinksAPI:
             tag: Filter by tag.
             archived: Include archived links.
             sort: Sort by created, clicks, or updated.
+            raw: Return the decoded response (``data`` and ``meta``) without building Link objects.
 
         Returns:
             A page of links plus pagination metadata.
         """
-        params = map_snake_keys(
-            {
-                "page": page,
-                "per_page": per_page,
-                "search": search,
-                "domain": domain,
-                "tag": tag,
-                "archived": archived,
-                "sort": sort,
-            }
+        params = map_query_pairs(
+            (
+                ("page", page),
+                ("per_page", per_page),
+                ("search", search),
+                ("domain", domain),
+                ("tag", tag),
+                ("archived", archived),
+                ("sort", sort),
+            )
         )
-        response = await self._client._request("GET", "/links", params=params)
+        response = await self._client._request("GET", self._links_url, params=params)
+        if raw:
+            return self._raw(response)
         data = response.get("data", [])
         meta = response.get("meta")
-        links = [Link.from_dict(item) for item in data] if isinstance(data, list) else []
+        links = list(map(self._parse_link, data)) if isinstance(data, list) else []
         meta_obj = LinkListMeta.from_dict(meta) if isinstance(meta, dict) else None
         return LinkPage(data=links, meta=meta_obj)
 
-    async def get(self, link_id: str) -> Link:
+    @overload
+    async def get(self, link_id: str, *, raw: Literal[False] = ...) -> Link: ...
+
+    @overload
+    async def get(self, link_id: str, *, raw: Literal[True]) -> dict[str, Any]: ...
+
+    @overload
+    async def get(self, link_id: str, *, raw: bool) -> Link | dict[str, Any]: ...
+
+    async def get(self, link_id: str, *, raw: bool = False) -> Link | dict[str, Any]:
         """Fetch a single link by ID.
 
         Args:
             link_id: Link identifier.
+            raw: Return the decoded link payload instead of a Link.
 
         Returns:
             The requested Link.
         """
-        response = await self._client._request("GET", f"/links/{link_id}")
+        response = await self._client._request("GET", self._link_url(link_id))
         data = response.get("data", response)
-        return Link.from_dict(data)
+        if raw:
+            return self._raw(data if isinstance(data, dict) else response)
+        return self._parse_link(data)
 
     async def update(
         self,
@@ -203,32 +304,32 @@ class LinksAPI:
         Returns:
             The updated Link.
         """
-        payload = map_snake_keys(
-            {
-                "destination_url": destination_url,
-                "slug": slug,
-                "domain": domain,
-                "title": title,
-                "description": description,
-                "tags": tags,
-                "password": password,
-                "expires_at": expires_at,
-                "click_limit": click_limit,
-                "geo_targets": geo_targets,
-                "device_targets": device_targets,
-                "ios_url": ios_url,
-                "android_url": android_url,
-                "utm_source": utm_source,
-                "utm_medium": utm_medium,
-                "utm_campaign": utm_campaign,
-                "utm_term": utm_term,
-                "utm_content": utm_content,
-                "is_archived": is_archived,
-            }
+        payload = map_snake_pairs(
+            (
+                ("destination_url", destination_url),
+                ("slug", slug),
+                ("domain", domain),
+                ("title", title),
+                ("description", description),
+                ("tags", tags),
+                ("password", password),
+                ("expires_at", expires_at),
+                ("click_limit", click_limit),
+                ("geo_targets", geo_targets),
+                ("device_targets", device_targets),
+                ("ios_url", ios_url),
+                ("android_url", android_url),
+                ("utm_source", utm_source),
+                ("utm_medium", utm_medium),
+                ("utm_campaign", utm_campaign),
+                ("utm_term", utm_term),
+                ("utm_content", utm_content),
+                ("is_archived", is_archived),
+            )
         )
-        response = await self._client._request("PATCH", f"/links/{link_id}", json=payload)
+        response = await self._client._request("PATCH", self._link_url(link_id), json=payload)
         data = response.get("data", response)
-        return Link.from_dict(data)
+        return self._parse_link(data)
 
     async def delete(self, link_id: str) -> None:
         """Archive (soft delete) a link.
@@ -236,20 +337,72 @@ class LinksAPI:
         Args:
             link_id: Link identifier.
         """
-        await self._client._request("DELETE", f"/links/{link_id}")
+        await self._client._request("DELETE", self._link_url(link_id))
         return None
 
-    async def stats(self, link_id: str) -> LinkStats:
+    @overload
+    async def stats(self, link_id: str, *, raw: Literal[False] = ...) -> LinkStats: ...
+
+    @overload
+    async def stats(self, link_id: str, *, raw: Literal[True]) -> dict[str, Any]: ...
+
+    @overload
+    async def stats(self, link_id: str, *, raw: bool) -> LinkStats | dict[str, Any]: ...
+
+    async def stats(self, link_id: str, *, raw: bool = False) -> LinkStats | dict[str, Any]:
         """Retrieve analytics for a link.
 
         Args:
             link_id: Link identifier.
+            raw: Return the decoded analytics payload instead of LinkStats.
 
         Returns:
             Analytics for the link.
         """
-        response = await self._client._request("GET", f"/links/{link_id}/stats")
+        response = await self._client._request("GET", self._link_url(link_id) / "stats")
         data = response.get("data", response)
         if isinstance(data, dict):
-            return LinkStats.from_dict(data)
-        return LinkStats()
+            return self._raw(data) if raw else LinkStats.from_dict(data)
+        return {} if raw else LinkStats()
+
+    async def bulk_create(
+        self,
+        specs: Iterable[Mapping[str, Any]],
+        *,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> builtins.list[Link | BaseException]:
+        """Create many links concurrently.
+
+        Args:
+            specs: Keyword arguments for each create call.
+            max_concurrency: Maximum number of requests in flight; must be at least 1.
+
+        Returns:
+            Results in the order of specs; failed creates are returned as their exception.
+        """
+        semaphore = _semaphore(max_concurrency)
+        return await asyncio.gather(
+            *(_bounded(semaphore, partial(self.create, **spec)) for spec in specs),
+            return_exceptions=True,
+        )
+
+    async def bulk_get(
+        self,
+        link_ids: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> builtins.list[Link | BaseException]:
+        """Fetch many links concurrently.
+
+        Args:
+            link_ids: Link identifiers.
+            max_concurrency: Maximum number of requests in flight; must be at least 1.
+
+        Returns:
+            Results in the order of link_ids; failed fetches are returned as their exception.
+        """
+        semaphore = _semaphore(max_concurrency)
+        return await asyncio.gather(
+            *(_bounded(semaphore, partial(self.get, link_id)) for link_id in link_ids),
+            return_exceptions=True,
+        )
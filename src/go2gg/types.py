@@ -2,13 +2,31 @@ from __future__ import annotations
 
 """Typed models for go2.gg API responses."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
-from go2gg.payloads import get_first
+from go2gg.payloads import make_picker
 
+# Slotted dataclasses drop the per-instance __dict__; dataclass(slots=...) needs Python 3.10+.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+# Fields the API may return in either camelCase or snake_case (camelCase is checked first).
+_pick_link_id = make_picker("id", "linkId")
+_pick_short_url = make_picker("shortUrl", "short_url")
+_pick_destination_url = make_picker("destinationUrl", "destination_url")
+_pick_has_password = make_picker("hasPassword", "has_password")
+_pick_expires_at = make_picker("expiresAt", "expires_at")
+_pick_click_count = make_picker("clickCount", "click_count")
+_pick_created_at = make_picker("createdAt", "created_at")
+_pick_updated_at = make_picker("updatedAt", "updated_at")
+_pick_per_page = make_picker("perPage", "per_page")
+_pick_has_more = make_picker("hasMore", "has_more")
+_pick_total_clicks = make_picker("totalClicks", "total_clicks")
+_pick_last_clicked_at = make_picker("lastClickedAt", "last_clicked_at")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Link:
     """Represents a short link returned by the API."""
     id: str
@@ -27,37 +45,40 @@ class Link:
     raw: dict[str, Any] | None = None
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Link":
+    def from_dict(cls, data: dict[str, Any], *, keep_raw: bool = False) -> "Link":
         """Create a Link from an API response dictionary.
 
         Args:
             data: Parsed API response payload.
+            keep_raw: Whether to keep the payload on the Link as ``raw``.
 
         Returns:
             A Link instance.
         """
-        link_id = get_first(data, "id", "linkId")
+        link_id = _pick_link_id(data)
         if link_id is None:
             raise ValueError("Link id is missing from the response.")
+        get = data.get
+        # Positional arguments in field order are noticeably cheaper than keywords on large list pages.
         return cls(
-            id=str(link_id),
-            short_url=get_first(data, "shortUrl", "short_url"),
-            destination_url=get_first(data, "destinationUrl", "destination_url"),
-            slug=get_first(data, "slug"),
-            domain=get_first(data, "domain"),
-            title=get_first(data, "title"),
-            description=get_first(data, "description"),
-            tags=get_first(data, "tags"),
-            has_password=get_first(data, "hasPassword", "has_password"),
-            expires_at=get_first(data, "expiresAt", "expires_at"),
-            click_count=get_first(data, "clickCount", "click_count"),
-            created_at=get_first(data, "createdAt", "created_at"),
-            updated_at=get_first(data, "updatedAt", "updated_at"),
-            raw=data,
+            str(link_id),
+            _pick_short_url(data),
+            _pick_destination_url(data),
+            get("slug"),
+            get("domain"),
+            get("title"),
+            get("description"),
+            get("tags"),
+            _pick_has_password(data),
+            _pick_expires_at(data),
+            _pick_click_count(data),
+            _pick_created_at(data),
+            _pick_updated_at(data),
+            data if keep_raw else None,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class LinkListMeta:
     """Pagination metadata for link listings."""
     page: int | None = None
@@ -76,56 +97,66 @@ class LinkListMeta:
             A LinkListMeta instance.
         """
         return cls(
-            page=get_first(data, "page"),
-            per_page=get_first(data, "perPage", "per_page"),
-            total=get_first(data, "total"),
-            has_more=get_first(data, "hasMore", "has_more"),
+            page=data.get("page"),
+            per_page=_pick_per_page(data),
+            total=data.get("total"),
+            has_more=_pick_has_more(data),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class LinkPage:
     """A page of links and optional pagination metadata."""
     data: list[Link]
     meta: LinkListMeta | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CountByCountry:
     """Aggregated click counts by country code."""
     country: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CountByDevice:
     """Aggregated click counts by device type."""
     device: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CountByBrowser:
     """Aggregated click counts by browser name."""
     browser: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CountByReferrer:
     """Aggregated click counts by referrer."""
     referrer: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CountByDate:
     """Aggregated click counts by date."""
     date: str
     count: int
 
 
-@dataclass(frozen=True)
+# Breakdown lists in a stats response: (response key, LinkStats field, row type, row label key).
+_STATS_SECTIONS: tuple[tuple[str, str, Any, str], ...] = (
+    ("byCountry", "by_country", CountByCountry, "country"),
+    ("byDevice", "by_device", CountByDevice, "device"),
+    ("byBrowser", "by_browser", CountByBrowser, "browser"),
+    ("byReferrer", "by_referrer", CountByReferrer, "referrer"),
+    ("overTime", "over_time", CountByDate, "date"),
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class LinkStats:
     """Analytics data for a link."""
     total_clicks: int | None = None
@@ -146,52 +177,17 @@ class LinkStats:
         Returns:
             A LinkStats instance.
         """
-        by_country = None
-        if isinstance(data.get("byCountry"), list):
-            by_country = [
-                CountByCountry(country=item["country"], count=item["count"])
-                for item in data["byCountry"]
-                if "country" in item and "count" in item
-            ]
-
-        by_device = None
-        if isinstance(data.get("byDevice"), list):
-            by_device = [
-                CountByDevice(device=item["device"], count=item["count"])
-                for item in data["byDevice"]
-                if "device" in item and "count" in item
-            ]
-
-        by_browser = None
-        if isinstance(data.get("byBrowser"), list):
-            by_browser = [
-                CountByBrowser(browser=item["browser"], count=item["count"])
-                for item in data["byBrowser"]
-                if "browser" in item and "count" in item
-            ]
-
-        by_referrer = None
-        if isinstance(data.get("byReferrer"), list):
-            by_referrer = [
-                CountByReferrer(referrer=item["referrer"], count=item["count"])
-                for item in data["byReferrer"]
-                if "referrer" in item and "count" in item
-            ]
-
-        over_time = None
-        if isinstance(data.get("overTime"), list):
-            over_time = [
-                CountByDate(date=item["date"], count=item["count"])
-                for item in data["overTime"]
-                if "date" in item and "count" in item
-            ]
+        get = data.get
+        sections: dict[str, Any] = {}
+        for key, field, row_cls, label in _STATS_SECTIONS:
+            items = get(key)
+            if isinstance(items, list):
+                sections[field] = [
+                    row_cls(item[label], item["count"]) for item in items if label in item and "count" in item
+                ]
 
         return cls(
-            total_clicks=get_first(data, "totalClicks", "total_clicks"),
-            last_clicked_at=get_first(data, "lastClickedAt", "last_clicked_at"),
-            by_country=by_country,
-            by_device=by_device,
-            by_browser=by_browser,
-            by_referrer=by_referrer,
-            over_time=over_time,
+            total_clicks=_pick_total_clicks(data),
+            last_clicked_at=_pick_last_clicked_at(data),
+            **sections,
         )
@@ -0,0 +1,26 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import pytest
+
+from go2gg import Go2Client
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[Go2Client]:
+    async with Go2Client(api_key="test-key") as go2_client:
+        yield go2_client
+
+
+@pytest.fixture
+def sleep_delays() -> list[float]:
+    return []
+
+
+@pytest.fixture
+def recording_sleep(sleep_delays: list[float]) -> Callable[[float], Awaitable[None]]:
+    """A retry_sleep stand-in that records each delay into sleep_delays without waiting."""
+
+    async def sleep(delay: float) -> None:
+        sleep_delays.append(delay)
+
+    return sleep
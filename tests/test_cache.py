@@ -0,0 +1,168 @@
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from go2gg import Go2Client
+from go2gg.client import CacheEntry
+
+BASE_URL = "https://api.go2.gg/api/v1"
+LINK_URL = f"{BASE_URL}/links/lnk_abc123"
+LINK_PAYLOAD = {"success": True, "data": {"id": "lnk_abc123", "title": "Summer Sale"}}
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_reuses_cached_payload() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"ETag": '"v1"'})
+        mock.get(LINK_URL, status=304)
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            first = await client.links.get("lnk_abc123")
+            second = await client.links.get("lnk_abc123")
+
+        requests = mock.requests[("GET", URL(LINK_URL))]
+        assert len(requests) == 2
+        assert requests[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert first == second
+        assert second.title == "Summer Sale"
+
+
+@pytest.mark.asyncio
+async def test_max_age_serves_from_cache_without_request() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=60"})
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            await client.links.get("lnk_abc123")
+            link = await client.links.get("lnk_abc123")
+
+        assert len(mock.requests[("GET", URL(LINK_URL))]) == 1
+        assert link.id == "lnk_abc123"
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_cached_entry() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=60"})
+        mock.patch(LINK_URL, payload=LINK_PAYLOAD)
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            await client.links.get("lnk_abc123")
+            assert len(cache) == 1
+            await client.links.update("lnk_abc123", title="Summer Sale")
+
+        assert cache == {}
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_list_pages_and_stats() -> None:
+    cache: dict[str, CacheEntry] = {}
+    fresh = {"Cache-Control": "max-age=60"}
+    list_payload = {"success": True, "data": [], "meta": {"page": 1}}
+    other_url = f"{BASE_URL}/links/lnk_other"
+
+    with aioresponses() as mock:
+        mock.get(f"{BASE_URL}/links?page=1", payload=list_payload, headers=fresh)
+        mock.get(f"{LINK_URL}/stats", payload={"success": True, "data": {}}, headers=fresh)
+        mock.get(other_url, payload={"success": True, "data": {"id": "lnk_other"}}, headers=fresh)
+        mock.patch(LINK_URL, payload=LINK_PAYLOAD)
+        mock.post(f"{BASE_URL}/links", payload=LINK_PAYLOAD)
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            await client.links.list(page=1)
+            await client.links.stats("lnk_abc123")
+            await client.links.get("lnk_other")
+            assert len(cache) == 3
+
+            await client.links.update("lnk_abc123", title="Summer Sale")
+            assert [key.split(" ", 1)[1] for key in cache] == [other_url]
+
+            await client.links.create(destination_url="https://example.com")
+            assert cache == {}
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_is_scoped_by_api_key() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=60"})
+        mock.get(LINK_URL, payload={"success": True, "data": {"id": "lnk_abc123", "title": "Other account"}})
+
+        async with Go2Client(api_key="key-a", cache=cache) as first:
+            await first.links.get("lnk_abc123")
+        async with Go2Client(api_key="key-b", cache=cache) as second:
+            link = await second.links.get("lnk_abc123")
+
+        assert len(mock.requests[("GET", URL(LINK_URL))]) == 2
+        assert link.title == "Other account"
+        assert not any("key-a" in key or "key-b" in key for key in cache)
+
+
+@pytest.mark.asyncio
+async def test_no_store_responses_are_not_cached() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"ETag": '"v1"', "Cache-Control": "no-store"})
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            await client.links.get("lnk_abc123")
+
+    assert cache == {}
+
+
+@pytest.mark.asyncio
+async def test_raw_results_do_not_alias_cached_payload() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=60"})
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            first = await client.links.get("lnk_abc123", raw=True)
+            first["id"] = "mutated"
+            second = await client.links.get("lnk_abc123", raw=True)
+            link = await client.links.get("lnk_abc123")
+
+    assert second["id"] == "lnk_abc123"
+    assert link.id == "lnk_abc123"
+
+
+@pytest.mark.asyncio
+async def test_invalid_max_age_is_not_served_from_cache() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=abc"})
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=abc"})
+
+        async with Go2Client(api_key="test-key", cache=cache) as client:
+            await client.links.get("lnk_abc123")
+            await client.links.get("lnk_abc123")
+
+        assert len(mock.requests[("GET", URL(LINK_URL))]) == 2
+        assert cache == {}
+
+
+@pytest.mark.asyncio
+async def test_kept_raw_does_not_alias_cached_payload() -> None:
+    cache: dict[str, CacheEntry] = {}
+
+    with aioresponses() as mock:
+        mock.get(LINK_URL, payload=LINK_PAYLOAD, headers={"Cache-Control": "max-age=60"})
+
+        async with Go2Client(api_key="test-key", cache=cache, keep_raw=True) as client:
+            first = await client.links.get("lnk_abc123")
+            assert first.raw is not None
+            first.raw["title"] = "mutated"
+            second = await client.links.get("lnk_abc123")
+
+    assert second.title == "Summer Sale"
+    assert second.raw is not None and second.raw["title"] == "Summer Sale"
@@ -39,3 +39,51 @@ async def test_client_raises_request_error() -> None:
         async with Go2Client(api_key="test-key") as client:
             with pytest.raises(RequestError):
                 await client.links.get("lnk_abc123")
+
+
+@pytest.mark.asyncio
+async def test_client_wraps_non_json_error_body() -> None:
+    with aioresponses() as mock:
+        mock.get(f"{BASE_URL}/links/lnk_abc123", status=502, body="Bad Gateway")
+
+        async with Go2Client(api_key="test-key") as client:
+            with pytest.raises(APIError) as excinfo:
+                await client.links.get("lnk_abc123")
+
+        assert excinfo.value.status_code == 502
+        assert excinfo.value.message == "Bad Gateway"
+
+
+@pytest.mark.asyncio
+async def test_client_skips_json_decode_for_html_error() -> None:
+    with aioresponses() as mock:
+        mock.get(
+            f"{BASE_URL}/links/lnk_abc123",
+            status=503,
+            body="<html>Service Unavailable</html>",
+            content_type="text/html",
+        )
+
+        async with Go2Client(api_key="test-key") as client:
+            with pytest.raises(APIError) as excinfo:
+                await client.links.get("lnk_abc123")
+
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.message == "<html>Service Unavailable</html>"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_type", ["text/plain", "application/octet-stream"])
+async def test_client_decodes_mislabelled_json_success(content_type: str) -> None:
+    with aioresponses() as mock:
+        mock.get(
+            f"{BASE_URL}/links/lnk_abc123",
+            status=200,
+            body='{"success": true, "data": {"id": "lnk_abc123"}}',
+            content_type=content_type,
+        )
+
+        async with Go2Client(api_key="test-key") as client:
+            link = await client.links.get("lnk_abc123")
+
+        assert link.id == "lnk_abc123"
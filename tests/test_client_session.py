@@ -0,0 +1,131 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from go2gg import Go2Client, close_shared_sessions
+from go2gg._pool import _shared_sessions
+
+BASE_URL = "https://api.go2.gg/api/v1"
+
+
+@pytest.mark.asyncio
+async def test_default_connector_pool_applied(client: Go2Client) -> None:
+    connector = client._session.connector
+    assert isinstance(connector, aiohttp.TCPConnector)
+    assert connector.limit == 100
+    assert connector.limit_per_host == 50
+    assert connector.force_close is False
+
+
+@pytest.mark.asyncio
+async def test_custom_connector_pool_overrides_defaults() -> None:
+    async with Go2Client(api_key="test-key", connector_limit=10, connector_limit_per_host=5) as client:
+        connector = client._session.connector
+        assert connector is not None
+        assert connector.limit == 10
+        assert connector.limit_per_host == 5
+
+
+@pytest.mark.asyncio
+async def test_external_session_is_not_closed() -> None:
+    session = aiohttp.ClientSession()
+    try:
+        async with Go2Client(api_key="test-key", session=session) as client:
+            assert client._session is session
+        assert not session.closed
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_set_on_managed_session() -> None:
+    async with Go2Client(api_key="test-key", user_agent="go2gg-tests") as client:
+        assert client._session.headers["Authorization"] == "Bearer test-key"
+        assert client._session.headers["User-Agent"] == "go2gg-tests"
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_sent_per_request_with_external_session() -> None:
+    with aioresponses() as mock:
+        mock.delete(f"{BASE_URL}/links/lnk_abc123", status=204)
+
+        async with aiohttp.ClientSession() as session:
+            client = Go2Client(api_key="test-key", session=session)
+            await client.links.delete("lnk_abc123")
+
+        request = mock.requests[("DELETE", URL(f"{BASE_URL}/links/lnk_abc123"))][0]
+        assert request.kwargs["headers"] == {"Authorization": "Bearer test-key"}
+        assert "Authorization" not in session.headers
+
+
+@pytest.mark.asyncio
+async def test_retry_status_codes_are_frozen() -> None:
+    async with Go2Client(api_key="test-key", retry_status_codes=[503]) as client:
+        assert client._retry.status_codes == frozenset({503})
+
+
+@pytest.mark.asyncio
+async def test_shared_session_reused_across_clients() -> None:
+    try:
+        async with Go2Client(api_key="key-one", shared_session=True) as first:
+            shared = first._session
+        async with Go2Client(api_key="key-two", shared_session=True, timeout_total=5.0) as second:
+            assert second._session is shared
+        assert not shared.closed
+        assert "Authorization" not in shared.headers
+
+        with aioresponses() as mock:
+            mock.delete(f"{BASE_URL}/links/lnk_abc123", status=204)
+            await second.links.delete("lnk_abc123")
+
+        request = mock.requests[("DELETE", URL(f"{BASE_URL}/links/lnk_abc123"))][0]
+        assert request.kwargs["headers"]["Authorization"] == "Bearer key-two"
+        assert request.kwargs["timeout"].total == 5.0
+    finally:
+        await close_shared_sessions()
+    assert shared.closed
+
+
+def test_shared_session_rejects_explicit_session() -> None:
+    with pytest.raises(ValueError):
+        Go2Client(api_key="test-key", session=object(), shared_session=True)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_shared_session_requests_reuse_client_timeout() -> None:
+    try:
+        with aioresponses() as mock:
+            mock.delete(f"{BASE_URL}/links/lnk_a", status=204)
+            mock.delete(f"{BASE_URL}/links/lnk_b", status=204)
+
+            async with Go2Client(api_key="test-key", shared_session=True) as client:
+                await client.links.delete("lnk_a")
+                await client.links.delete("lnk_b")
+
+        first = mock.requests[("DELETE", URL(f"{BASE_URL}/links/lnk_a"))][0].kwargs["timeout"]
+        second = mock.requests[("DELETE", URL(f"{BASE_URL}/links/lnk_b"))][0].kwargs["timeout"]
+        assert first == second == client._timeout
+    finally:
+        await close_shared_sessions()
+
+
+def test_shared_session_of_closed_loop_is_evicted() -> None:
+    async def open_shared() -> aiohttp.ClientSession:
+        async with Go2Client(api_key="test-key", shared_session=True) as client:
+            return client._session
+
+    first = asyncio.run(open_shared())
+    try:
+        second = asyncio.run(open_shared())
+        assert second is not first
+        assert first not in _shared_sessions.values()
+        assert list(_shared_sessions.values()) == [second]
+    finally:
+        # Neither loop called close_shared_sessions(); detach so the test does not leak warnings.
+        first.detach()
+        for session in _shared_sessions.values():
+            session.detach()
+        _shared_sessions.clear()
@@ -0,0 +1,26 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from go2gg import install_fast_event_loop
+
+
+def test_install_fast_event_loop_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert install_fast_event_loop() is False
+
+
+def test_install_fast_event_loop_sets_uvloop_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakePolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    policies: list[asyncio.AbstractEventLoopPolicy] = []
+    fake_uvloop = types.ModuleType("uvloop")
+    fake_uvloop.EventLoopPolicy = FakePolicy  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", policies.append)
+
+    assert install_fast_event_loop() is True
+    assert isinstance(policies[0], FakePolicy)
@@ -1,7 +1,10 @@
+import re
+
+import orjson
 import pytest
 from aioresponses import aioresponses
 
-from go2gg import Go2Client
+from go2gg import APIError, Go2Client, Link
 
 BASE_URL = "https://api.go2.gg/api/v1"
 
@@ -34,7 +37,8 @@ async def test_links_create_happy_path() -> None:
             )
 
         request = mock.requests[("POST", f"{BASE_URL}/links")][0]
-        assert request.kwargs["json"] == {
+        assert request.kwargs["headers"]["Content-Type"] == "application/json"
+        assert orjson.loads(request.kwargs["data"]) == {
             "destinationUrl": "https://example.com/landing",
             "slug": "summer-sale",
             "title": "Summer Sale Campaign",
@@ -69,7 +73,7 @@ async def test_links_list_with_pagination() -> None:
             page = await client.links.list(per_page=10, sort="clicks")
 
         request = mock.requests[("GET", f"{BASE_URL}/links")][0]
-        assert request.kwargs["params"] == {"perPage": 10, "sort": "clicks"}
+        assert request.kwargs["params"] == {"perPage": "10", "sort": "clicks"}
         assert page.meta and page.meta.total == 47
         assert page.data[0].id == "lnk_abc123"
 
@@ -95,3 +99,138 @@ async def test_links_stats_parsing() -> None:
         assert stats.total_clicks == 1542
         assert stats.by_country and stats.by_country[0].country == "US"
         assert stats.by_device and stats.by_device[0].device == "desktop"
+
+
+@pytest.mark.asyncio
+async def test_links_get_builds_url_from_base() -> None:
+    response_payload = {"success": True, "data": {"id": "lnk_abc123"}}
+
+    with aioresponses() as mock:
+        mock.get("https://example.test/api/v1/links/lnk_abc123", payload=response_payload)
+
+        async with Go2Client(api_key="test-key", base_url="https://example.test/api/v1/") as client:
+            link = await client.links.get("lnk_abc123")
+
+        assert link.id == "lnk_abc123"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("link_id", "path"),
+    [("a/b", "/api/v1/links/a%2Fb/stats"), ("a%2Fb", "/api/v1/links/a%252Fb/stats")],
+)
+async def test_links_id_is_encoded_as_one_path_segment(link_id: str, path: str) -> None:
+    with aioresponses() as mock:
+        mock.get(re.compile(r".*/stats$"), payload={"success": True, "data": {}})
+
+        async with Go2Client(api_key="test-key") as client:
+            await client.links.stats(link_id)
+
+        ((_, url),) = mock.requests
+        assert url.raw_path == path
+
+
+@pytest.mark.asyncio
+async def test_links_bulk_create_returns_results_in_order() -> None:
+    ok_payload = {"success": True, "data": {"id": "lnk_one"}}
+    error_payload = {"success": False, "code": "SLUG_EXISTS", "message": "Already used"}
+
+    with aioresponses() as mock:
+        mock.post(f"{BASE_URL}/links", payload=ok_payload)
+        mock.post(f"{BASE_URL}/links", status=409, payload=error_payload)
+
+        async with Go2Client(api_key="test-key") as client:
+            results = await client.links.bulk_create(
+                [
+                    {"destination_url": "https://example.com/one"},
+                    {"destination_url": "https://example.com/two", "slug": "taken"},
+                ],
+                max_concurrency=1,
+            )
+
+    assert isinstance(results[0], Link) and results[0].id == "lnk_one"
+    assert isinstance(results[1], APIError) and results[1].error_code == "SLUG_EXISTS"
+
+
+@pytest.mark.asyncio
+async def test_links_bulk_create_returns_invalid_spec_as_its_exception() -> None:
+    with aioresponses() as mock:
+        mock.post(f"{BASE_URL}/links", payload={"success": True, "data": {"id": "lnk_one"}})
+
+        async with Go2Client(api_key="test-key") as client:
+            results = await client.links.bulk_create(
+                [{"bogus": 1}, {"destination_url": "https://example.com/one"}],
+                max_concurrency=1,
+            )
+
+    assert isinstance(results[0], TypeError)
+    assert isinstance(results[1], Link) and results[1].id == "lnk_one"
+
+
+@pytest.mark.asyncio
+async def test_links_bulk_get_fetches_each_link() -> None:
+    with aioresponses() as mock:
+        for link_id in ("lnk_a", "lnk_b", "lnk_c"):
+            mock.get(f"{BASE_URL}/links/{link_id}", payload={"success": True, "data": {"id": link_id}})
+
+        async with Go2Client(api_key="test-key") as client:
+            results = await client.links.bulk_get(["lnk_a", "lnk_b", "lnk_c"], max_concurrency=2)
+
+    assert [link.id for link in results if isinstance(link, Link)] == ["lnk_a", "lnk_b", "lnk_c"]
+
+
+@pytest.mark.asyncio
+async def test_links_get_keep_raw() -> None:
+    response_payload = {"success": True, "data": {"id": "lnk_abc123", "custom": "value"}}
+
+    with aioresponses() as mock:
+        mock.get(f"{BASE_URL}/links/lnk_abc123", payload=response_payload)
+
+        async with Go2Client(api_key="test-key", keep_raw=True) as client:
+            link = await client.links.get("lnk_abc123")
+
+    assert link.raw == {"id": "lnk_abc123", "custom": "value"}
+
+
+@pytest.mark.asyncio
+async def test_links_raw_returns_payloads() -> None:
+    link_payload = {"id": "lnk_abc123", "shortUrl": "https://go2.gg/summer-sale"}
+    stats_payload = {"totalClicks": 3, "byCountry": [{"country": "US", "count": 3}]}
+
+    with aioresponses() as mock:
+        mock.get(f"{BASE_URL}/links/lnk_abc123", payload={"success": True, "data": link_payload})
+        mock.get(f"{BASE_URL}/links/lnk_abc123/stats", payload={"success": True, "data": stats_payload})
+
+        async with Go2Client(api_key="test-key") as client:
+            link = await client.links.get("lnk_abc123", raw=True)
+            stats = await client.links.stats("lnk_abc123", raw=True)
+
+    assert link == link_payload
+    assert stats == stats_payload
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw", [True, False])
+async def test_links_get_accepts_runtime_raw_flag(raw: bool) -> None:
+    link_payload = {"id": "lnk_abc123"}
+
+    with aioresponses() as mock:
+        mock.get(f"{BASE_URL}/links/lnk_abc123", payload={"success": True, "data": link_payload})
+
+        async with Go2Client(api_key="test-key") as client:
+            result = await client.links.get("lnk_abc123", raw=raw)
+
+    assert result == link_payload if raw else isinstance(result, Link)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_links_bulk_rejects_non_positive_concurrency(max_concurrency: int) -> None:
+    async with Go2Client(api_key="test-key") as client:
+        with pytest.raises(ValueError):
+            await client.links.bulk_get(["lnk_a"], max_concurrency=max_concurrency)
+        with pytest.raises(ValueError):
+            await client.links.bulk_create(
+                [{"destination_url": "https://example.com"}],
+                max_concurrency=max_concurrency,
+            )
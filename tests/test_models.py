@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from go2gg.types import Link, LinkStats
@@ -27,6 +29,54 @@ def test_link_from_dict_parses_fields() -> None:
     assert link.click_count == 42
 
 
+def test_link_from_dict_maps_every_field() -> None:
+    payload = {
+        "id": "lnk_abc123",
+        "shortUrl": "short",
+        "destinationUrl": "destination",
+        "slug": "slug",
+        "domain": "domain",
+        "title": "title",
+        "description": "description",
+        "tags": ["tag"],
+        "hasPassword": True,
+        "expiresAt": "expires",
+        "clickCount": 7,
+        "createdAt": "created",
+        "updatedAt": "updated",
+    }
+    link = Link.from_dict(payload, keep_raw=True)
+    assert link == Link(
+        id="lnk_abc123",
+        short_url="short",
+        destination_url="destination",
+        slug="slug",
+        domain="domain",
+        title="title",
+        description="description",
+        tags=["tag"],
+        has_password=True,
+        expires_at="expires",
+        click_count=7,
+        created_at="created",
+        updated_at="updated",
+        raw=payload,
+    )
+
+
+def test_link_from_dict_accepts_snake_case_keys() -> None:
+    link = Link.from_dict({"linkId": "lnk_abc123", "short_url": "https://go2.gg/a", "click_count": 0})
+    assert link.id == "lnk_abc123"
+    assert link.short_url == "https://go2.gg/a"
+    assert link.click_count == 0
+
+
+def test_link_from_dict_keeps_raw_only_when_requested() -> None:
+    payload = {"id": "lnk_abc123", "shortUrl": "https://go2.gg/a"}
+    assert Link.from_dict(payload).raw is None
+    assert Link.from_dict(payload, keep_raw=True).raw is payload
+
+
 def test_link_from_dict_missing_id_raises() -> None:
     with pytest.raises(ValueError):
         Link.from_dict({"shortUrl": "https://go2.gg/test"})
@@ -49,3 +99,18 @@ def test_link_stats_parsing() -> None:
     assert stats.by_browser and stats.by_browser[0].browser == "Chrome"
     assert stats.by_referrer and stats.by_referrer[0].referrer == "twitter.com"
     assert stats.over_time and stats.over_time[0].date == "2024-06-01"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+def test_models_do_not_carry_instance_dict() -> None:
+    link = Link.from_dict({"id": "lnk_abc123"})
+    stats = LinkStats.from_dict({"byCountry": [{"country": "US", "count": 1}]})
+    assert not hasattr(link, "__dict__")
+    assert not hasattr(stats, "__dict__")
+    assert stats.by_country and not hasattr(stats.by_country[0], "__dict__")
+
+
+def test_link_stats_skips_incomplete_rows() -> None:
+    stats = LinkStats.from_dict({"byCountry": [{"country": "US"}, {"country": "DE", "count": 3}], "byDevice": None})
+    assert stats.by_country and [row.country for row in stats.by_country] == ["DE"]
+    assert stats.by_device is None
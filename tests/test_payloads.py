@@ -1,4 +1,14 @@
-from go2gg.payloads import map_snake_keys, snake_to_camel
+import inspect
+
+from go2gg.payloads import (
+    _SNAKE_TO_CAMEL,
+    make_picker,
+    map_query_pairs,
+    map_snake_keys,
+    map_snake_pairs,
+    snake_to_camel,
+)
+from go2gg.resources import LinksAPI
 
 
 def test_snake_to_camel() -> None:
@@ -6,6 +16,13 @@ def test_snake_to_camel() -> None:
     assert snake_to_camel("utm_source") == "utmSource"
 
 
+def test_snake_to_camel_is_memoized() -> None:
+    snake_to_camel.cache_clear()
+    snake_to_camel("custom_field")
+    snake_to_camel("custom_field")
+    assert snake_to_camel.cache_info().hits == 1
+
+
 def test_map_snake_keys_drops_none_and_converts() -> None:
     payload = {
         "destination_url": "https://example.com",
@@ -17,3 +34,37 @@ def test_map_snake_keys_drops_none_and_converts() -> None:
         "destinationUrl": "https://example.com",
         "utmSource": "email",
     }
+
+
+def test_map_snake_keys_converts_unknown_keys() -> None:
+    assert map_snake_keys({"custom_field_name": 1}) == {"customFieldName": 1}
+
+
+def test_map_snake_pairs_drops_none_and_converts() -> None:
+    pairs = (("destination_url", "https://example.com"), ("click_limit", None), ("is_archived", False))
+    assert map_snake_pairs(pairs) == {"destinationUrl": "https://example.com", "isArchived": False}
+
+
+def test_map_query_pairs_stringifies_values() -> None:
+    pairs = (("per_page", 10), ("archived", False), ("search", None), ("sort", "clicks"))
+    assert map_query_pairs(pairs) == {"perPage": "10", "archived": "false", "sort": "clicks"}
+
+
+def test_make_picker_returns_first_present_key() -> None:
+    pick = make_picker("clickCount", "click_count")
+    assert pick({"clickCount": 0, "click_count": 5}) == 0
+    assert pick({"click_count": 5}) == 5
+    assert pick({}) is None
+    assert make_picker("a", "b", "c")({"c": 3}) == 3
+
+
+def test_camel_table_covers_links_api_parameters() -> None:
+    for method in (LinksAPI.create, LinksAPI.update, LinksAPI.list):
+        names = [
+            name
+            for name, param in inspect.signature(method).parameters.items()
+            if param.kind is inspect.Parameter.KEYWORD_ONLY and name != "raw"
+        ]
+        missing = [name for name in names if name not in _SNAKE_TO_CAMEL]
+        assert not missing, f"{method.__name__} parameters missing from _SNAKE_TO_CAMEL: {missing}"
+        assert all(_SNAKE_TO_CAMEL[name] == snake_to_camel(name) for name in names)
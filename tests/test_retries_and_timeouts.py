@@ -1,23 +1,25 @@
-import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import formatdate
 
 import aiohttp
 import pytest
 from aioresponses import aioresponses
 
 from go2gg import Go2Client
+from go2gg.client import DEFAULT_TIMEOUT, RetryPolicy
 from go2gg.exceptions import APIError
 
 BASE_URL = "https://api.go2.gg/api/v1"
 
 
 @pytest.mark.asyncio
-async def test_default_timeouts_applied() -> None:
-    async with Go2Client(api_key="test-key") as client:
-        timeout = client._session.timeout
-        assert timeout.total == 30.0
-        assert timeout.connect == 10.0
-        assert timeout.sock_read == 30.0
-        assert timeout.sock_connect == 10.0
+async def test_default_timeouts_applied(client: Go2Client) -> None:
+    timeout = client._session.timeout
+    assert timeout.total == 30.0
+    assert timeout.connect == 10.0
+    assert timeout.sock_read == 30.0
+    assert timeout.sock_connect == 10.0
 
 
 @pytest.mark.asyncio
@@ -70,14 +72,9 @@ async def test_retries_enabled_success_after_failure() -> None:
 
 
 @pytest.mark.asyncio
-async def test_retry_backoff_increases_delay(monkeypatch: pytest.MonkeyPatch) -> None:
-    delays: list[float] = []
-
-    async def fake_sleep(delay: float) -> None:
-        delays.append(delay)
-
-    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
-
+async def test_retry_backoff_increases_delay(
+    recording_sleep: Callable[[float], Awaitable[None]], sleep_delays: list[float]
+) -> None:
     error_payload = {"message": "server error"}
     ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
 
@@ -91,10 +88,11 @@ async def test_retry_backoff_increases_delay(monkeypatch: pytest.MonkeyPatch) ->
             retry_count=2,
             retry_delay=0.5,
             retry_backoff=True,
+            retry_sleep=recording_sleep,
         ) as client:
             await client.links.create(destination_url="https://example.com")
 
-    assert delays == [0.5, 1.0]
+    assert sleep_delays == [0.5, 1.0]
 
 
 @pytest.mark.asyncio
@@ -115,3 +113,157 @@ async def test_retry_on_network_error() -> None:
             link = await client.links.create(destination_url="https://example.com")
 
         assert link.id == "lnk_ok"
+
+
+@pytest.mark.asyncio
+async def test_retry_honors_retry_after_header(
+    recording_sleep: Callable[[float], Awaitable[None]], sleep_delays: list[float]
+) -> None:
+    ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
+
+    with aioresponses() as mock:
+        mock.post(
+            f"{BASE_URL}/links",
+            status=429,
+            payload={"message": "slow down"},
+            headers={"Retry-After": "2"},
+        )
+        mock.post(f"{BASE_URL}/links", status=200, payload=ok_payload)
+
+        async with Go2Client(api_key="test-key", retry_count=1, retry_delay=0.5, retry_sleep=recording_sleep) as client:
+            link = await client.links.create(destination_url="https://example.com")
+
+    assert link.id == "lnk_ok"
+    assert sleep_delays == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_honors_retry_after_http_date(
+    recording_sleep: Callable[[float], Awaitable[None]], sleep_delays: list[float]
+) -> None:
+    ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
+
+    with aioresponses() as mock:
+        mock.post(
+            f"{BASE_URL}/links",
+            status=503,
+            payload={"message": "maintenance"},
+            headers={"Retry-After": formatdate(time.time() + 10, usegmt=True)},
+        )
+        mock.post(f"{BASE_URL}/links", status=200, payload=ok_payload)
+
+        async with Go2Client(api_key="test-key", retry_count=1, retry_delay=0.5, retry_sleep=recording_sleep) as client:
+            link = await client.links.create(destination_url="https://example.com")
+
+    assert link.id == "lnk_ok"
+    assert len(sleep_delays) == 1
+    assert 8.0 < sleep_delays[0] <= 10.0
+
+
+@pytest.mark.asyncio
+async def test_retry_jitter_randomizes_delay(
+    recording_sleep: Callable[[float], Awaitable[None]], sleep_delays: list[float]
+) -> None:
+    error_payload = {"message": "server error"}
+    ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
+
+    with aioresponses() as mock:
+        mock.post(f"{BASE_URL}/links", status=503, payload=error_payload)
+        mock.post(f"{BASE_URL}/links", status=503, payload=error_payload)
+        mock.post(f"{BASE_URL}/links", status=200, payload=ok_payload)
+
+        async with Go2Client(
+            api_key="test-key",
+            retry_count=2,
+            retry_delay=0.5,
+            retry_backoff=True,
+            retry_jitter=True,
+            retry_sleep=recording_sleep,
+        ) as client:
+            await client.links.create(destination_url="https://example.com")
+
+    assert len(sleep_delays) == 2
+    assert 0.5 <= sleep_delays[0] <= 1.5
+    assert 0.5 <= sleep_delays[1] <= 4.5
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_capped_by_max_delay(
+    recording_sleep: Callable[[float], Awaitable[None]], sleep_delays: list[float]
+) -> None:
+    error_payload = {"message": "server error"}
+    ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
+
+    with aioresponses() as mock:
+        mock.post(f"{BASE_URL}/links", status=502, payload=error_payload)
+        mock.post(f"{BASE_URL}/links", status=502, payload=error_payload)
+        mock.post(f"{BASE_URL}/links", status=502, payload=error_payload)
+        mock.post(f"{BASE_URL}/links", status=200, payload=ok_payload)
+
+        async with Go2Client(
+            api_key="test-key",
+            retry_count=3,
+            retry_delay=1.0,
+            retry_backoff=True,
+            retry_max_delay=3.0,
+            retry_sleep=recording_sleep,
+        ) as client:
+            await client.links.create(destination_url="https://example.com")
+
+    assert sleep_delays == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [408, 425, 529])
+async def test_transient_statuses_retried_by_default(status: int) -> None:
+    ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
+
+    with aioresponses() as mock:
+        mock.post(f"{BASE_URL}/links", status=status, payload={"message": "try again"})
+        mock.post(f"{BASE_URL}/links", status=200, payload=ok_payload)
+
+        async with Go2Client(api_key="test-key", retry_count=1, retry_delay=0) as client:
+            link = await client.links.create(destination_url="https://example.com")
+
+    assert link.id == "lnk_ok"
+
+
+@pytest.mark.asyncio
+async def test_zero_retry_delay_skips_sleep(
+    recording_sleep: Callable[[float], Awaitable[None]], sleep_delays: list[float]
+) -> None:
+    ok_payload = {"success": True, "data": {"id": "lnk_ok", "shortUrl": "https://go2.gg/ok"}}
+
+    with aioresponses() as mock:
+        mock.post(f"{BASE_URL}/links", status=500, payload={"message": "server error"})
+        mock.post(f"{BASE_URL}/links", status=500, payload={"message": "server error"}, headers={"Retry-After": "0"})
+        mock.post(f"{BASE_URL}/links", status=200, payload=ok_payload)
+
+        async with Go2Client(api_key="test-key", retry_count=2, retry_delay=0, retry_sleep=recording_sleep) as client:
+            await client.links.create(destination_url="https://example.com")
+
+    assert sleep_delays == []
+
+
+def test_retry_policy_delay_schedule() -> None:
+    policy = RetryPolicy(
+        retries=3,
+        delay=0.5,
+        backoff=True,
+        jitter=False,
+        max_delay=1.5,
+        status_codes=frozenset({500}),
+    )
+    assert [policy.delay_for(attempt) for attempt in range(3)] == [0.5, 1.0, 1.5]
+    assert policy.delay_for(0, retry_after=10.0) == 1.5
+
+    constant = policy._replace(delay=60.0, backoff=False, max_delay=30.0)
+    assert [constant.delay_for(attempt) for attempt in range(3)] == [30.0, 30.0, 30.0]
+    jittered = constant._replace(jitter=True)
+    assert all(jittered.delay_for(attempt) == 30.0 for attempt in range(3))
+
+
+@pytest.mark.asyncio
+async def test_default_timeout_instance_shared() -> None:
+    async with Go2Client(api_key="test-key") as first, Go2Client(api_key="test-key") as second:
+        assert first._timeout is second._timeout is DEFAULT_TIMEOUT